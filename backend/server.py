@@ -1,13 +1,23 @@
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
-from pydantic import BaseModel
-from typing import List, Dict, Optional
-import pymongo
+from fastapi.responses import Response, ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from typing import List, Dict, Optional, Set
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from motor.motor_asyncio import AsyncIOMotorClient
+from cachetools import TTLCache
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+import redis.asyncio as aioredis
 import os
 import uuid
-import json
+import secrets
+import orjson
 import asyncio
+import anyio
+import heapq
+import time
 from datetime import datetime, timedelta
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
@@ -16,8 +26,19 @@ from reportlab.lib.units import inch
 from reportlab.lib import colors
 from io import BytesIO
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await create_indexes()
+    if REDIS_URL:
+        await manager.start_relay(REDIS_URL)
+    timer_task = asyncio.create_task(run_poll_timers())
+    yield
+    timer_task.cancel()
+    await manager.stop_relay()
+    client.close()
+
 # Initialize FastAPI
-app = FastAPI()
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 app.add_middleware(
@@ -28,9 +49,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# MongoDB connection
+# MongoDB connection. Each gunicorn/uvicorn worker imports this module after
+# forking, so every worker process owns its own client and connection pool.
 MONGO_URL = os.environ.get("MONGO_URL", "mongodb://localhost:27017")
-client = pymongo.MongoClient(MONGO_URL)
+MONGO_MAX_POOL_SIZE = int(os.environ.get("MONGO_MAX_POOL_SIZE", "100"))
+client = AsyncIOMotorClient(MONGO_URL, maxPoolSize=MONGO_MAX_POOL_SIZE)
 db = client.poll_app
 
 # Collections
@@ -39,88 +62,361 @@ polls_collection = db.polls
 votes_collection = db.votes
 participants_collection = db.participants
 
+# Abandoned meetings are purged by MongoDB TTL indexes after this long
+ROOM_DATA_TTL_SECONDS = 24 * 60 * 60
+
+async def create_indexes():
+    """Create indexes backing the hot query paths (no-op if they already exist)"""
+    await rooms_collection.create_index("room_id", unique=True)
+    await polls_collection.create_index("poll_id", unique=True)
+    await polls_collection.create_index([("room_id", 1), ("is_active", 1)])
+    await votes_collection.create_index([("poll_id", 1), ("selected_option", 1)])
+    await votes_collection.create_index([("poll_id", 1), ("participant_token", 1)], unique=True)
+    await votes_collection.create_index([("room_id", 1), ("poll_id", 1)])
+    await participants_collection.create_index("participant_token", unique=True)
+    await participants_collection.create_index("participant_id", unique=True)
+    await participants_collection.create_index([("room_id", 1), ("approval_status", 1)])
+    
+    # TTL indexes so rooms that never call cleanup do not keep data forever
+    await rooms_collection.create_index("created_at", expireAfterSeconds=ROOM_DATA_TTL_SECONDS)
+    await polls_collection.create_index("created_at", expireAfterSeconds=ROOM_DATA_TTL_SECONDS)
+    await votes_collection.create_index("voted_at", expireAfterSeconds=ROOM_DATA_TTL_SECONDS)
+    await participants_collection.create_index("joined_at", expireAfterSeconds=ROOM_DATA_TTL_SECONDS)
+
+# Active room lookups (existence and organizer name) cached briefly per worker,
+# since a room's metadata never changes after creation. Cleanup evicts a room on
+# every worker through the Redis relay that multiple workers need anyway; a
+# worker that misses the eviction still drops the room within the TTL.
+ROOM_CACHE_TTL_SECONDS = 5
+room_cache = TTLCache(maxsize=10_000, ttl=ROOM_CACHE_TTL_SECONDS)
+
+async def get_active_room(room_id: str) -> Optional[dict]:
+    room = room_cache.get(room_id)
+    if room is None:
+        room = await rooms_collection.find_one({"room_id": room_id, "is_active": True}, {"_id": 0, "organizer_name": 1})
+        if room:
+            room_cache[room_id] = room
+    return room
+
+# Redis pub/sub relay, required when running more than one worker so that a
+# broadcast reaches sockets connected to the other workers
+REDIS_URL = os.environ.get("REDIS_URL")
+ROOM_CHANNEL_PREFIX = "room:"
+ROOM_EVICT_CHANNEL = "room_cache_evict"
+
+# Sockets sent to concurrently per batch when broadcasting to a room
+BROADCAST_BATCH_SIZE = 50
+
 # WebSocket connections manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+        self.active_connections: Dict[str, Set[WebSocket]] = defaultdict(set)
+        self.redis = None
+        self.relay_task = None
+
+    async def start_relay(self, redis_url: str):
+        """Route broadcasts through Redis so every worker relays them to its own sockets"""
+        self.redis = aioredis.from_url(redis_url)
+        pubsub = self.redis.pubsub()
+        await pubsub.psubscribe(f"{ROOM_CHANNEL_PREFIX}*")
+        await pubsub.subscribe(ROOM_EVICT_CHANNEL)
+        self.relay_task = asyncio.create_task(self._relay(pubsub))
+
+    async def stop_relay(self):
+        if self.relay_task:
+            self.relay_task.cancel()
+        if self.redis:
+            await self.redis.aclose()
+
+    async def _relay(self, pubsub):
+        async for message in pubsub.listen():
+            if message["type"] == "pmessage":
+                room_id = message["channel"].decode()[len(ROOM_CHANNEL_PREFIX):]
+                await self.send_to_local(room_id, message["data"])
+            elif message["type"] == "message":
+                room_cache.pop(message["data"].decode(), None)
+
+    async def evict_room(self, room_id: str):
+        """Drop a room from the room cache of every worker"""
+        room_cache.pop(room_id, None)
+        if self.redis:
+            await self.redis.publish(ROOM_EVICT_CHANNEL, room_id)
 
     async def connect(self, websocket: WebSocket, room_id: str):
         await websocket.accept()
-        if room_id not in self.active_connections:
-            self.active_connections[room_id] = []
-        self.active_connections[room_id].append(websocket)
+        self.active_connections[room_id].add(websocket)
 
     def disconnect(self, websocket: WebSocket, room_id: str):
-        if room_id in self.active_connections:
-            self.active_connections[room_id].remove(websocket)
+        connections = self.active_connections.get(room_id)
+        if connections is None:
+            return
+        connections.discard(websocket)
+        if not connections:
+            # Forget rooms with no sockets left so the dict does not grow forever
+            del self.active_connections[room_id]
 
     async def broadcast_to_room(self, room_id: str, message: dict):
-        if room_id in self.active_connections:
-            for connection in self.active_connections[room_id]:
-                try:
-                    await connection.send_text(json.dumps(message))
-                except:
-                    pass
+        if self.redis or room_id in self.active_connections:
+            # Encode once; every socket is sent the same bytes
+            await self.broadcast_payload(room_id, orjson.dumps(message))
+
+    async def broadcast_payload(self, room_id: str, payload: bytes):
+        if self.redis:
+            # Every worker, this one included, receives it back through _relay
+            await self.redis.publish(f"{ROOM_CHANNEL_PREFIX}{room_id}", payload)
+        else:
+            await self.send_to_local(room_id, payload)
+
+    async def send_to_local(self, room_id: str, payload: bytes):
+        # Snapshot the set: sockets may (dis)connect while the sends are in flight
+        connections = list(self.active_connections.get(room_id, ()))
+        if not connections:
+            return
+        
+        # Large rooms are sent in batches, yielding between them so other
+        # requests are not starved while a broadcast fans out
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(0)
+            batch = connections[start:start + BROADCAST_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(connection.send_bytes(payload) for connection in batch),
+                return_exceptions=True
+            )
+            
+            # Drop sockets whose send failed so they are not retried on every broadcast
+            dead = [connection for connection, result in zip(batch, results) if isinstance(result, Exception)]
+            for connection in dead:
+                self.disconnect(connection, room_id)
 
 manager = ConnectionManager()
 
-# Store active poll timers
-active_timers = {}
+# Poll timers: a heap of (deadline, poll_id, room_id, stop_at) drained by a single
+# scheduler task. active_timers maps a poll to its live deadline; heap entries
+# that no longer match it were cancelled or restarted and are skipped. stop_at is
+# the deadline stored on the poll document, so a timer left on another worker by
+# an earlier start cannot stop the poll once it has been restarted or stopped.
+poll_deadlines: List[tuple] = []
+active_timers: Dict[str, float] = {}
+timer_wakeup = asyncio.Event()
 
-async def auto_stop_poll(poll_id: str, room_id: str, delay_minutes: int):
-    """Auto-stop a poll after specified minutes"""
-    await asyncio.sleep(delay_minutes * 60)  # Convert minutes to seconds
-    
-    # Check if poll is still active
-    poll = polls_collection.find_one({"poll_id": poll_id, "is_active": True})
-    if poll:
-        # Stop the poll
-        polls_collection.update_one(
-            {"poll_id": poll_id},
-            {"$set": {"is_active": False}}
-        )
+def schedule_poll_stop(poll_id: str, room_id: str, delay_minutes: int, stop_at: datetime):
+    deadline = time.monotonic() + delay_minutes * 60  # Convert minutes to seconds
+    active_timers[poll_id] = deadline
+    heapq.heappush(poll_deadlines, (deadline, poll_id, room_id, stop_at))
+    if poll_deadlines[0][0] == deadline:
+        # New earliest deadline; wake the scheduler so it re-arms its sleep
+        timer_wakeup.set()
+
+def cancel_poll_stop(poll_id: str):
+    active_timers.pop(poll_id, None)
+
+async def run_poll_timers():
+    """Auto-stop polls as their deadlines pass"""
+    while True:
+        timer_wakeup.clear()
+        now = time.monotonic()
+        due = []
+        while poll_deadlines and poll_deadlines[0][0] <= now:
+            deadline, poll_id, room_id, stop_at = heapq.heappop(poll_deadlines)
+            if active_timers.get(poll_id) == deadline:
+                del active_timers[poll_id]
+                due.append(auto_stop_poll(poll_id, room_id, stop_at))
+        if due:
+            await asyncio.gather(*due, return_exceptions=True)
+            continue
         
+        timeout = poll_deadlines[0][0] - now if poll_deadlines else None
+        try:
+            await asyncio.wait_for(timer_wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+async def auto_stop_poll(poll_id: str, room_id: str, stop_at: datetime):
+    """Stop a poll whose timer has run out"""
+    # Stop the poll only if it is still active and was not restarted since
+    result = await polls_collection.update_one(
+        {"poll_id": poll_id, "is_active": True, "stop_at": stop_at},
+        {"$set": {"is_active": False}, "$unset": {"stop_at": ""}}
+    )
+    if result.modified_count:
         # Broadcast poll auto-stop
         await manager.broadcast_to_room(room_id, {
             "type": "poll_auto_stopped",
             "poll_id": poll_id,
             "message": "Poll automatically stopped due to timer"
         })
-        
-        # Remove from active timers
-        if poll_id in active_timers:
-            del active_timers[poll_id]
 
-# Pydantic models
-class Room(BaseModel):
-    room_id: str
-    organizer_name: str
-    created_at: datetime
-    is_active: bool = True
+# Participant counters kept on the room document, so reading them never counts documents
+PARTICIPANT_COUNT_FIELDS = {"_id": 0, "participant_count": 1, "approved_count": 1, "pending_count": 1}
 
-class Poll(BaseModel):
-    poll_id: str
-    room_id: str
-    question: str
-    options: List[str]
-    is_active: bool = False
-    created_at: datetime
+def read_participant_counts(room: dict) -> Dict[str, int]:
+    return {field: room.get(field, 0) for field in ("participant_count", "approved_count", "pending_count")}
 
-class Vote(BaseModel):
-    vote_id: str
-    poll_id: str
-    room_id: str
-    participant_token: str
-    selected_option: str
-    voted_at: datetime
+# Fields approve/deny need to update the counters and notify the participant
+PARTICIPANT_NOTIFY_FIELDS = {
+    "_id": 0, "room_id": 1, "participant_token": 1, "participant_name": 1, "approval_status": 1
+}
 
-class Participant(BaseModel):
-    participant_id: str
-    room_id: str
-    participant_name: str
-    participant_token: str
-    approval_status: str  # "pending", "approved", "denied"
-    joined_at: datetime
+async def move_participant(participant_id: str, new_status: str) -> Optional[dict]:
+    """Set a participant's approval status and shift the room counters to match.
+    
+    Returns the participant as it was before the change, or None if it does not exist.
+    """
+    # Only a participant not already in new_status matches, so a concurrent
+    # approve/deny of the same participant moves the counters once
+    participant = await participants_collection.find_one_and_update(
+        {"participant_id": participant_id, "approval_status": {"$ne": new_status}},
+        {"$set": {"approval_status": new_status}},
+        projection=PARTICIPANT_NOTIFY_FIELDS,
+        return_document=ReturnDocument.BEFORE
+    )
+    if participant is None:
+        # Either missing or already in new_status, which leaves the counters alone
+        return await participants_collection.find_one({"participant_id": participant_id}, PARTICIPANT_NOTIFY_FIELDS)
+    
+    old_status = participant["approval_status"]
+    deltas = {}
+    if old_status in ("approved", "pending"):
+        deltas[f"{old_status}_count"] = -1
+    if new_status in ("approved", "pending"):
+        deltas[f"{new_status}_count"] = 1
+    await rooms_collection.update_one({"room_id": participant["room_id"]}, {"$inc": deltas})
+    return participant
+
+async def count_votes(poll_id: str, options: List[str]) -> Dict[str, int]:
+    """Tally votes per option for a single poll in one aggregation"""
+    vote_counts = {option: 0 for option in options}
+    async for row in votes_collection.aggregate([
+        {"$match": {"poll_id": poll_id}},
+        {"$group": {"_id": "$selected_option", "count": {"$sum": 1}}}
+    ]):
+        if row["_id"] in vote_counts:
+            vote_counts[row["_id"]] = row["count"]
+    return vote_counts
+
+async def count_room_votes(room_id: str, poll_id: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+    """Tally votes per option for every poll in a room (or just poll_id) in one aggregation"""
+    room_vote_counts: Dict[str, Dict[str, int]] = {}
+    vote_filter = {"room_id": room_id}
+    if poll_id:
+        vote_filter["poll_id"] = poll_id
+    async for row in votes_collection.aggregate([
+        {"$match": vote_filter},
+        {"$group": {
+            "_id": {"poll_id": "$poll_id", "option": "$selected_option"},
+            "count": {"$sum": 1}
+        }}
+    ]):
+        room_vote_counts.setdefault(row["_id"]["poll_id"], {})[row["_id"]["option"]] = row["count"]
+    return room_vote_counts
+
+# With REDIS_URL set, live tallies are also kept as one Redis hash per poll so a
+# vote is an HINCRBY instead of a recount; MongoDB stays the source of truth. The
+# hash is created with the poll, before it can take any vote, so it is never built
+# from a count that a concurrent vote could outdate; once it has expired the
+# poll's tallies come from MongoDB instead.
+VOTE_COUNTS_KEY_PREFIX = "poll_votes:"
+
+# Counts a vote in an existing tally and returns the whole hash, in one atomic
+# step; a missing tally stays missing
+INCREMENT_VOTE_COUNT_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return false
+end
+redis.call('HINCRBY', KEYS[1], ARGV[1], 1)
+return redis.call('HGETALL', KEYS[1])
+"""
+
+async def create_vote_counts(polls: List[dict]):
+    """Start the Redis tally of each new poll at zero"""
+    async with manager.redis.pipeline(transaction=False) as pipe:
+        for poll in polls:
+            if poll["options"]:
+                key = f"{VOTE_COUNTS_KEY_PREFIX}{poll['poll_id']}"
+                pipe.hset(key, mapping={option: 0 for option in poll["options"]})
+                pipe.expire(key, ROOM_DATA_TTL_SECONDS)
+        await pipe.execute()
+
+def decode_vote_counts(stored: Dict[bytes, bytes], options: List[str]) -> Dict[str, int]:
+    return {option: int(stored.get(option.encode(), 0)) for option in options}
+
+async def increment_vote_count(poll_id: str, options: List[str], option: str) -> Optional[Dict[str, int]]:
+    """Count a stored vote in the poll's Redis tally; returns the tally, or None without one"""
+    stored = await manager.redis.eval(INCREMENT_VOTE_COUNT_SCRIPT, 1, f"{VOTE_COUNTS_KEY_PREFIX}{poll_id}", option)
+    if stored is None:
+        return None
+    return decode_vote_counts(dict(zip(stored[::2], stored[1::2])), options)
+
+async def record_vote_count(poll_id: str, options: List[str], option: str) -> Dict[str, int]:
+    """Count a stored vote and return the poll's tally including it, without recounting"""
+    if manager.redis:
+        vote_counts = await increment_vote_count(poll_id, options, option)
+        if vote_counts is not None:
+            return vote_counts
+    # No Redis tally: keep one on the poll document, keyed by option index since
+    # options may contain "." or "$"
+    poll = await polls_collection.find_one_and_update(
+        {"poll_id": poll_id},
+        {"$inc": {f"option_votes.{options.index(option)}": 1}},
+        projection={"_id": 0, "option_votes": 1},
+        return_document=ReturnDocument.AFTER
+    )
+    option_votes = poll.get("option_votes", {}) if poll else {}
+    return {name: option_votes.get(str(index), 0) for index, name in enumerate(options)}
+
+async def read_vote_counts(poll_id: str, options: List[str]) -> Dict[str, int]:
+    """Current tally for a poll, from Redis when available"""
+    if manager.redis:
+        stored = await manager.redis.hgetall(f"{VOTE_COUNTS_KEY_PREFIX}{poll_id}")
+        if stored:
+            return decode_vote_counts(stored, options)
+    return await count_votes(poll_id, options)
+
+# Debounced vote_update broadcasts, one pending flush per poll
+VOTE_UPDATE_DELAY = 0.1  # seconds, i.e. at most 10 updates per poll per second
+pending_vote_updates: Dict[str, asyncio.Task] = {}
+
+async def flush_vote_update(poll_id: str, room_id: str):
+    """Broadcast the latest vote counts for a poll once the debounce window closes"""
+    await asyncio.sleep(VOTE_UPDATE_DELAY)
+    
+    # Votes recorded from now on schedule a new flush
+    pending_vote_updates.pop(poll_id, None)
+    
+    poll = await polls_collection.find_one({"poll_id": poll_id}, {"_id": 0, "options": 1})
+    if not poll:
+        return
+    
+    vote_counts = await read_vote_counts(poll_id, poll["options"])
+    await manager.broadcast_to_room(room_id, {
+        "type": "vote_update",
+        "poll_id": poll_id,
+        "vote_counts": vote_counts,
+        "total_votes": sum(vote_counts.values())
+    })
+
+# Debounced participant_update broadcasts, one pending flush per room
+PARTICIPANT_UPDATE_DELAY = 0.1  # seconds
+pending_participant_updates: Dict[str, asyncio.Task] = {}
+
+async def flush_participant_update(room_id: str):
+    """Broadcast the latest participant counts for a room once the debounce window closes"""
+    await asyncio.sleep(PARTICIPANT_UPDATE_DELAY)
+    
+    # Joins recorded from now on schedule a new flush
+    pending_participant_updates.pop(room_id, None)
+    
+    room = await rooms_collection.find_one({"room_id": room_id}, PARTICIPANT_COUNT_FIELDS)
+    if not room:
+        return
+    
+    counts = read_participant_counts(room)
+    await manager.broadcast_to_room(room_id, {
+        "type": "participant_update",
+        "participant_count": counts["participant_count"],
+        "pending_count": counts["pending_count"]
+    })
 
 # API Routes
 
@@ -128,10 +424,14 @@ class Participant(BaseModel):
 async def health_check():
     return {"status": "healthy"}
 
+# Random room IDs are 8 hex characters; a collision is rare enough that a few redraws always suffice
+RANDOM_ROOM_ID_ATTEMPTS = 5
+
 @app.post("/api/rooms/create")
 async def create_room(organizer_name: str, custom_room_id: str = None):
     # Generate room ID
-    if custom_room_id and custom_room_id.strip():
+    custom_id = bool(custom_room_id and custom_room_id.strip())
+    if custom_id:
         # Validate custom room ID
         clean_id = custom_room_id.strip().upper()
         
@@ -143,37 +443,48 @@ async def create_room(organizer_name: str, custom_room_id: str = None):
         if not clean_id.isalnum():
             raise HTTPException(status_code=400, detail="Custom room ID must contain only letters and numbers")
         
-        # Check if custom room ID already exists
-        existing_room = rooms_collection.find_one({"room_id": clean_id})
-        if existing_room:
-            raise HTTPException(status_code=400, detail="Room ID already exists. Please choose a different ID.")
-        
         room_id = clean_id
     else:
-        # Generate random room ID if no custom ID provided
-        room_id = str(uuid.uuid4())[:8].upper()
-    
-    room = {
-        "room_id": room_id,
-        "organizer_name": organizer_name,
-        "created_at": datetime.now(),
-        "is_active": True
-    }
-    
-    rooms_collection.insert_one(room)
+        room_id = None
+    
+    # The unique index on room_id rejects IDs that are already taken; a clashing
+    # random ID is simply redrawn
+    for _ in range(RANDOM_ROOM_ID_ATTEMPTS):
+        if not custom_id:
+            # Generate random room ID if no custom ID provided
+            room_id = secrets.token_hex(4).upper()
+        
+        room = {
+            "room_id": room_id,
+            "organizer_name": organizer_name,
+            "created_at": datetime.now(),
+            "is_active": True,
+            "participant_count": 0,
+            "approved_count": 0,
+            "pending_count": 0
+        }
+        
+        try:
+            await rooms_collection.insert_one(room)
+            break
+        except DuplicateKeyError:
+            if custom_id:
+                raise HTTPException(status_code=400, detail="Room ID already exists. Please choose a different ID.")
+    else:
+        raise HTTPException(status_code=503, detail="Could not allocate a room ID, please try again")
     
     return {"room_id": room_id, "organizer_name": organizer_name}
 
 @app.post("/api/rooms/join")
 async def join_room(room_id: str, participant_name: str):
     # Check if room exists and is active
-    room = rooms_collection.find_one({"room_id": room_id, "is_active": True})
+    room = await get_active_room(room_id)
     if not room:
         raise HTTPException(status_code=404, detail="Room not found or inactive")
     
     # Generate participant token
-    participant_token = str(uuid.uuid4())
-    participant_id = str(uuid.uuid4())
+    participant_token = secrets.token_urlsafe(16)
+    participant_id = uuid.uuid4().hex
     
     participant = {
         "participant_id": participant_id,
@@ -184,82 +495,134 @@ async def join_room(room_id: str, participant_name: str):
         "joined_at": datetime.now()
     }
     
-    participants_collection.insert_one(participant)
-    
-    # Broadcast participant update to organizer
-    participant_count = participants_collection.count_documents({"room_id": room_id})
-    pending_count = participants_collection.count_documents({"room_id": room_id, "approval_status": "pending"})
+    await participants_collection.insert_one(participant)
+    await rooms_collection.update_one(
+        {"room_id": room_id},
+        {"$inc": {"participant_count": 1, "pending_count": 1}}
+    )
     
-    await manager.broadcast_to_room(room_id, {
-        "type": "participant_update",
-        "participant_count": participant_count,
-        "pending_count": pending_count
-    })
+    # Broadcast participant update to organizer, coalescing a burst of joins
+    if room_id not in pending_participant_updates:
+        pending_participant_updates[room_id] = asyncio.create_task(flush_participant_update(room_id))
     
     return {
         "participant_token": participant_token,
+        "participant_id": participant_id,
         "participant_name": participant_name,
         "room_id": room_id,
         "approval_status": "pending",
         "organizer_name": room["organizer_name"]
     }
 
-class PollCreateRequest(BaseModel):
-    room_id: str
+# Request bodies; stored documents are plain dicts built by the handlers.
+# Unknown fields and oversized strings are rejected by pydantic-core before a handler runs.
+REQUEST_MODEL_CONFIG = ConfigDict(extra="forbid", str_max_length=256)
+
+class PollDefinition(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
     question: str
     options: List[str]
     timer_minutes: Optional[int] = None  # Optional timer in minutes
 
+class PollCreateRequest(PollDefinition):
+    room_id: str
+
+class BulkPollCreateRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
+    room_id: str
+    polls: List[PollDefinition]
+
+def new_poll(room_id: str, definition: PollDefinition) -> dict:
+    return {
+        "poll_id": uuid.uuid4().hex,
+        "room_id": room_id,
+        "question": definition.question,
+        "options": definition.options,
+        "timer_minutes": definition.timer_minutes,
+        "is_active": False,
+        "created_at": datetime.now()
+    }
+
+async def broadcast_new_poll(poll: dict):
+    # Built field by field: insert_one/insert_many add a non-serializable _id to the dict
+    await manager.broadcast_to_room(poll["room_id"], {
+        "type": "new_poll",
+        "poll": {
+            "poll_id": poll["poll_id"],
+            "question": poll["question"],
+            "options": poll["options"],
+            "timer_minutes": poll["timer_minutes"],
+            "is_active": False,
+            "created_at": poll["created_at"]
+        }
+    })
+
 @app.post("/api/polls/create")
 async def create_poll(request: PollCreateRequest):
-    room = rooms_collection.find_one({"room_id": request.room_id, "is_active": True})
+    room = await get_active_room(request.room_id)
     if not room:
         raise HTTPException(status_code=404, detail="Room not found")
     
-    poll_id = str(uuid.uuid4())
+    poll = new_poll(request.room_id, request)
+    await polls_collection.insert_one(poll)
+    if manager.redis:
+        await create_vote_counts([poll])
     
-    poll = {
-        "poll_id": poll_id,
-        "room_id": request.room_id,
-        "question": request.question,
-        "options": request.options,
-        "timer_minutes": request.timer_minutes,
-        "is_active": False,
-        "created_at": datetime.now()
-    }
+    # Broadcast new poll to room
+    await broadcast_new_poll(poll)
     
-    polls_collection.insert_one(poll)
+    return {"poll_id": poll["poll_id"], "question": request.question, "options": request.options}
+
+@app.post("/api/polls/create_bulk")
+async def create_polls(request: BulkPollCreateRequest):
+    """Create several polls in one room with a single request and insert"""
+    room = await get_active_room(request.room_id)
+    if not room:
+        raise HTTPException(status_code=404, detail="Room not found")
+    if not request.polls:
+        return {"poll_ids": []}
     
-    # Broadcast new poll to room
-    await manager.broadcast_to_room(request.room_id, {
-        "type": "new_poll",
-        "poll": poll
-    })
+    polls = [new_poll(request.room_id, definition) for definition in request.polls]
+    await polls_collection.insert_many(polls)
+    if manager.redis:
+        await create_vote_counts(polls)
+    
+    for poll in polls:
+        await broadcast_new_poll(poll)
     
-    return {"poll_id": poll_id, "question": request.question, "options": request.options}
+    return {"poll_ids": [poll["poll_id"] for poll in polls]}
 
-@app.post("/api/polls/{poll_id}/start")
-async def start_poll(poll_id: str):
-    poll = polls_collection.find_one({"poll_id": poll_id})
+# Shape of the room's active polls in status and start responses
+ACTIVE_POLL_FIELDS = {"_id": 0, "poll_id": 1, "question": 1, "options": 1, "is_active": 1}
+
+async def activate_poll(poll_id: str, restart: bool = False) -> List[dict]:
+    """Mark a poll active, (re)start its timer and announce it; returns the room's active polls"""
+    # stop_at is null without a timer, which also voids a deadline left by an earlier start
+    poll = await polls_collection.find_one_and_update(
+        {"poll_id": poll_id},
+        [{"$set": {
+            "is_active": True,
+            "stop_at": {"$add": ["$$NOW", {"$multiply": ["$timer_minutes", 60 * 1000]}]}
+        }}],
+        projection={"_id": 0, "room_id": 1, "question": 1, "options": 1, "timer_minutes": 1, "stop_at": 1},
+        return_document=ReturnDocument.AFTER
+    )
     if not poll:
         raise HTTPException(status_code=404, detail="Poll not found")
     
-    polls_collection.update_one(
-        {"poll_id": poll_id},
-        {"$set": {"is_active": True}}
-    )
+    if restart:
+        # Clients drop the poll here and add it back from poll_started
+        await manager.broadcast_to_room(poll["room_id"], {
+            "type": "poll_stopped",
+            "poll_id": poll_id
+        })
     
-    # Start timer if specified
+    # Start timer if specified; this replaces any timer left from an earlier start
     if poll.get("timer_minutes"):
-        # Cancel existing timer if any
-        if poll_id in active_timers:
-            active_timers[poll_id].cancel()
-        
-        # Start new timer
-        timer_task = asyncio.create_task(
-            auto_stop_poll(poll_id, poll["room_id"], poll["timer_minutes"])
-        )
-        active_timers[poll_id] = timer_task
+        schedule_poll_stop(poll_id, poll["room_id"], poll["timer_minutes"], poll["stop_at"])
+    
     
     # Broadcast poll start
     await manager.broadcast_to_room(poll["room_id"], {
@@ -270,23 +633,32 @@ async def start_poll(poll_id: str):
         "timer_minutes": poll.get("timer_minutes")
     })
     
-    return {"message": "Poll started"}
+    # The room's active polls after the start, so callers need no status round-trip
+    return await polls_collection.find(
+        {"room_id": poll["room_id"], "is_active": True}, ACTIVE_POLL_FIELDS
+    ).to_list(length=None)
+
+@app.post("/api/polls/{poll_id}/start")
+async def start_poll(poll_id: str):
+    return {"message": "Poll started", "active_polls": await activate_poll(poll_id)}
+
+@app.post("/api/polls/{poll_id}/restart")
+async def restart_poll(poll_id: str):
+    """Stop and start a poll in one step; it stays active throughout and keeps its votes"""
+    return {"message": "Poll restarted", "active_polls": await activate_poll(poll_id, restart=True)}
 
 @app.post("/api/polls/{poll_id}/stop")
 async def stop_poll(poll_id: str):
-    poll = polls_collection.find_one({"poll_id": poll_id})
-    if not poll:
-        raise HTTPException(status_code=404, detail="Poll not found")
-    
-    polls_collection.update_one(
+    poll = await polls_collection.find_one_and_update(
         {"poll_id": poll_id},
-        {"$set": {"is_active": False}}
+        {"$set": {"is_active": False}, "$unset": {"stop_at": ""}},
+        projection={"_id": 0, "room_id": 1}
     )
+    if not poll:
+        raise HTTPException(status_code=404, detail="Poll not found")
     
     # Cancel timer if active
-    if poll_id in active_timers:
-        active_timers[poll_id].cancel()
-        del active_timers[poll_id]
+    cancel_poll_stop(poll_id)
     
     # Broadcast poll stop
     await manager.broadcast_to_room(poll["room_id"], {
@@ -297,37 +669,39 @@ async def stop_poll(poll_id: str):
     return {"message": "Poll stopped"}
 
 class VoteRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+    
     participant_token: str
     selected_option: str
 
 @app.post("/api/polls/{poll_id}/vote")
 async def vote(poll_id: str, request: VoteRequest):
-    poll = polls_collection.find_one({"poll_id": poll_id, "is_active": True})
-    if not poll:
+    # The filter only matches when the selected option is one of the poll's, so the
+    # option check rides along with the poll lookup
+    poll = await polls_collection.find_one(
+        {"poll_id": poll_id, "is_active": True, "options": request.selected_option},
+        {"_id": 0, "room_id": 1, "options": 1}
+    )
+    # Only a rejected vote pays for telling an invalid option from a missing poll
+    if not poll and not await polls_collection.find_one({"poll_id": poll_id, "is_active": True}, {"_id": 1}):
         raise HTTPException(status_code=404, detail="Poll not found or inactive")
     
     # Check if participant is approved to vote
-    participant = participants_collection.find_one({"participant_token": request.participant_token})
+    participant = await participants_collection.find_one(
+        {"participant_token": request.participant_token},
+        {"_id": 0, "approval_status": 1}
+    )
     if not participant:
         raise HTTPException(status_code=404, detail="Participant not found")
     
     if participant["approval_status"] != "approved":
         raise HTTPException(status_code=403, detail="Participant not approved to vote")
     
-    # Check if participant already voted for this poll
-    existing_vote = votes_collection.find_one({
-        "poll_id": poll_id,
-        "participant_token": request.participant_token
-    })
-    
-    if existing_vote:
-        raise HTTPException(status_code=400, detail="Already voted")
-    
     # Validate option
-    if request.selected_option not in poll["options"]:
+    if not poll:
         raise HTTPException(status_code=400, detail="Invalid option")
     
-    vote_id = str(uuid.uuid4())
+    vote_id = uuid.uuid4().hex
     
     vote = {
         "vote_id": vote_id,
@@ -338,126 +712,127 @@ async def vote(poll_id: str, request: VoteRequest):
         "voted_at": datetime.now()
     }
     
-    votes_collection.insert_one(vote)
+    # The unique (poll_id, participant_token) index rejects a second vote atomically
+    try:
+        await votes_collection.insert_one(vote)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Already voted")
     
-    # Broadcast vote count update to EVERYONE in the room (not just organizer)
-    vote_counts = {}
-    for option in poll["options"]:
-        count = votes_collection.count_documents({
-            "poll_id": poll_id,
-            "selected_option": option
-        })
-        vote_counts[option] = count
+    # The tally including this vote, so the voter needs no follow-up GET
+    vote_counts = await record_vote_count(poll_id, poll["options"], request.selected_option)
     
-    await manager.broadcast_to_room(poll["room_id"], {
-        "type": "vote_update",
-        "poll_id": poll_id,
-        "vote_counts": vote_counts,
-        "total_votes": sum(vote_counts.values())
-    })
+    # Broadcast vote count update to EVERYONE in the room (not just organizer),
+    # coalescing a burst of votes into a single update
+    if poll_id not in pending_vote_updates:
+        pending_vote_updates[poll_id] = asyncio.create_task(
+            flush_vote_update(poll_id, poll["room_id"])
+        )
     
-    return {"message": "Vote recorded"}
+    return {
+        "message": "Vote recorded",
+        "poll": {"poll_id": poll_id, "total_votes": sum(vote_counts.values()), "vote_counts": vote_counts}
+    }
 
 @app.get("/api/rooms/{room_id}/status")
 async def get_room_status(room_id: str):
-    room = rooms_collection.find_one({"room_id": room_id, "is_active": True})
-    if not room:
+    # One round-trip: the room's counters plus its poll totals and active polls
+    rooms = await rooms_collection.aggregate([
+        {"$match": {"room_id": room_id, "is_active": True}},
+        {"$limit": 1},
+        {"$lookup": {
+            "from": "polls",
+            "let": {"room_id": "$room_id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$room_id", "$$room_id"]}}},
+                {"$facet": {
+                    "total": [{"$count": "n"}],
+                    # Multiple polls can be active, projected straight to their JSON shape
+                    "active": [
+                        {"$match": {"is_active": True}},
+                        {"$project": ACTIVE_POLL_FIELDS}
+                    ]
+                }}
+            ],
+            "as": "polls"
+        }},
+        {"$project": {**PARTICIPANT_COUNT_FIELDS, "organizer_name": 1, "polls": {"$first": "$polls"}}}
+    ]).to_list(length=1)
+    if not rooms:
         raise HTTPException(status_code=404, detail="Room not found")
     
-    participant_count = participants_collection.count_documents({"room_id": room_id})
-    approved_count = participants_collection.count_documents({"room_id": room_id, "approval_status": "approved"})
-    pending_count = participants_collection.count_documents({"room_id": room_id, "approval_status": "pending"})
-    
-    # Get all polls for this room
-    all_polls = list(polls_collection.find({"room_id": room_id}))
-    
-    # Get all active polls (multiple can be active now)
-    active_polls = list(polls_collection.find({"room_id": room_id, "is_active": True}))
-    
-    # Clean up active polls for JSON serialization
-    clean_active_polls = []
-    for poll in active_polls:
-        clean_active_polls.append({
-            "poll_id": poll["poll_id"],
-            "question": poll["question"],
-            "options": poll["options"],
-            "is_active": poll["is_active"]
-        })
+    room = rooms[0]
+    counts = read_participant_counts(room)
+    total = room["polls"]["total"]
+    active_polls = room["polls"]["active"]
     
     return {
         "room_id": room_id,
         "organizer_name": room["organizer_name"],
-        "participant_count": participant_count,
-        "approved_count": approved_count,
-        "pending_count": pending_count,
-        "total_polls": len(all_polls),
-        "active_polls": clean_active_polls,  # Changed from single active_poll to multiple active_polls
+        "participant_count": counts["participant_count"],
+        "approved_count": counts["approved_count"],
+        "pending_count": counts["pending_count"],
+        "total_polls": total[0]["n"] if total else 0,
+        "active_polls": active_polls,  # Changed from single active_poll to multiple active_polls
         "active_poll_count": len(active_polls)
     }
 
 @app.get("/api/rooms/{room_id}/polls")
-async def get_all_polls(room_id: str):
-    room = rooms_collection.find_one({"room_id": room_id, "is_active": True})
+async def get_all_polls(room_id: str, poll_id: Optional[str] = None):
+    room = await get_active_room(room_id)
     if not room:
         raise HTTPException(status_code=404, detail="Room not found")
     
-    polls = list(polls_collection.find({"room_id": room_id}))
+    # ?poll_id= narrows the list to a single poll
+    poll_filter = {"room_id": room_id}
+    if poll_id:
+        poll_filter["poll_id"] = poll_id
+    
+    room_vote_counts = await count_room_votes(room_id, poll_id)
     
     # Clean up polls and add vote counts
     clean_polls = []
-    for poll in polls:
+    async for poll in polls_collection.find(
+        poll_filter,
+        {"_id": 0, "poll_id": 1, "question": 1, "options": 1, "is_active": 1, "created_at": 1}
+    ):
         # Calculate vote results for each poll
-        vote_counts = {}
-        for option in poll["options"]:
-            count = votes_collection.count_documents({
-                "poll_id": poll["poll_id"],
-                "selected_option": option
-            })
-            vote_counts[option] = count
+        poll_votes = room_vote_counts.get(poll["poll_id"], {})
+        vote_counts = {option: poll_votes.get(option, 0) for option in poll["options"]}
         
         clean_polls.append({
             "poll_id": poll["poll_id"],
             "question": poll["question"],
             "options": poll["options"],
             "is_active": poll["is_active"],
-            "created_at": poll["created_at"].isoformat(),
+            "created_at": poll["created_at"],
             "vote_counts": vote_counts,
             "total_votes": sum(vote_counts.values())
         })
     
-    return {"polls": clean_polls}
+    # Returned as a response so FastAPI skips jsonable_encoder; orjson writes the
+    # datetimes as the same ISO strings
+    return ORJSONResponse({"polls": clean_polls})
 
 @app.get("/api/rooms/{room_id}/participants")
 async def get_participants(room_id: str):
-    room = rooms_collection.find_one({"room_id": room_id, "is_active": True})
+    room = await get_active_room(room_id)
     if not room:
         raise HTTPException(status_code=404, detail="Room not found")
     
-    participants = list(participants_collection.find({"room_id": room_id}))
+    # Project straight to the JSON shape (no _id, no participant_token)
+    participants = await participants_collection.find(
+        {"room_id": room_id},
+        {"_id": 0, "participant_id": 1, "participant_name": 1, "approval_status": 1, "joined_at": 1}
+    ).to_list(length=None)
     
-    # Clean up participants for JSON serialization
-    clean_participants = []
-    for p in participants:
-        clean_participants.append({
-            "participant_id": p["participant_id"],
-            "participant_name": p["participant_name"],
-            "approval_status": p["approval_status"],
-            "joined_at": p["joined_at"].isoformat()
-        })
-    
-    return {"participants": clean_participants}
+    return ORJSONResponse({"participants": participants})
 
 @app.post("/api/participants/{participant_id}/approve")
 async def approve_participant(participant_id: str):
-    participant = participants_collection.find_one({"participant_id": participant_id})
+    participant = await move_participant(participant_id, "approved")
     if not participant:
         raise HTTPException(status_code=404, detail="Participant not found")
     
-    participants_collection.update_one(
-        {"participant_id": participant_id},
-        {"$set": {"approval_status": "approved"}}
-    )
-    
     # Broadcast approval to participant
     await manager.broadcast_to_room(participant["room_id"], {
         "type": "participant_approved",
@@ -469,15 +844,10 @@ async def approve_participant(participant_id: str):
 
 @app.post("/api/participants/{participant_id}/deny")
 async def deny_participant(participant_id: str):
-    participant = participants_collection.find_one({"participant_id": participant_id})
+    participant = await move_participant(participant_id, "denied")
     if not participant:
         raise HTTPException(status_code=404, detail="Participant not found")
     
-    participants_collection.update_one(
-        {"participant_id": participant_id},
-        {"$set": {"approval_status": "denied"}}
-    )
-    
     # Broadcast denial to participant
     await manager.broadcast_to_room(participant["room_id"], {
         "type": "participant_denied",
@@ -487,18 +857,104 @@ async def deny_participant(participant_id: str):
     
     return {"message": "Participant denied"}
 
-@app.get("/api/rooms/{room_id}/report")
-async def generate_pdf_report(room_id: str):
-    room = rooms_collection.find_one({"room_id": room_id})
-    if not room:
-        raise HTTPException(status_code=404, detail="Room not found")
+class BulkApproveRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
     
-    # Get all polls for this room
-    polls = list(polls_collection.find({"room_id": room_id}))
+    participant_ids: List[str]
+
+@app.post("/api/participants/approve_bulk")
+async def approve_participants(request: BulkApproveRequest):
+    # Each participant moves (and shifts the room counters) atomically on its own
+    results = await asyncio.gather(
+        *(move_participant(participant_id, "approved") for participant_id in request.participant_ids)
+    )
     
-    # Get all participants
-    participants = list(participants_collection.find({"room_id": room_id}))
+    approved = [participant for participant in results if participant]
+    not_found = [participant_id for participant_id, participant in zip(request.participant_ids, results) if not participant]
     
+    # Broadcast approvals to participants
+    await asyncio.gather(*(
+        manager.broadcast_to_room(participant["room_id"], {
+            "type": "participant_approved",
+            "participant_token": participant["participant_token"],
+            "participant_name": participant["participant_name"]
+        })
+        for participant in approved
+    ))
+    
+    return {"approved_count": len(approved), "not_found": not_found}
+
+# ReportLab styles shared by every report, built once at import
+REPORT_STYLES = getSampleStyleSheet()
+NORMAL_STYLE = REPORT_STYLES['Normal']
+
+TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=REPORT_STYLES['Heading1'],
+    fontSize=24,
+    spaceAfter=30,
+    alignment=1,  # Center alignment
+    textColor=colors.darkblue
+)
+
+HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=REPORT_STYLES['Heading2'],
+    fontSize=16,
+    spaceAfter=12,
+    textColor=colors.darkblue
+)
+
+FOOTER_STYLE = ParagraphStyle(
+    'Footer',
+    parent=NORMAL_STYLE,
+    fontSize=10,
+    textColor=colors.grey,
+    alignment=1
+)
+
+MEETING_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+])
+
+APPROVED_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+OTHER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+RESULTS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, -1), (-1, -1), colors.lightblue),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+def render_pdf_report(room: dict, polls: List[dict], participants: List[dict], room_vote_counts: Dict[str, Dict[str, int]]) -> bytes:
+    """Build the meeting report PDF (CPU-bound, run it off the event loop)"""
     # Create PDF in memory
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
@@ -506,51 +962,26 @@ async def generate_pdf_report(room_id: str):
     # Container for the 'Flowable' objects
     story = []
     
-    # Styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30,
-        alignment=1,  # Center alignment
-        textColor=colors.darkblue
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        spaceAfter=12,
-        textColor=colors.darkblue
-    )
-    
     # Title
-    story.append(Paragraph("Secret Poll Meeting Report", title_style))
+    story.append(Paragraph("Secret Poll Meeting Report", TITLE_STYLE))
     story.append(Spacer(1, 20))
     
     # Meeting Information
-    story.append(Paragraph("Meeting Information", heading_style))
+    story.append(Paragraph("Meeting Information", HEADING_STYLE))
     meeting_info = [
-        ['Room ID:', room_id],
+        ['Room ID:', room["room_id"]],
         ['Organizer:', room["organizer_name"]],
         ['Generated:', datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
         ['Total Participants:', str(len(participants))]
     ]
     
     meeting_table = Table(meeting_info, colWidths=[2*inch, 4*inch])
-    meeting_table.setStyle(TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-    ]))
+    meeting_table.setStyle(MEETING_TABLE_STYLE)
     story.append(meeting_table)
     story.append(Spacer(1, 20))
     
     # Participants Section
-    story.append(Paragraph("Registered Participants", heading_style))
+    story.append(Paragraph("Registered Participants", HEADING_STYLE))
     
     # Separate participants by approval status
     approved_participants = [p for p in participants if p["approval_status"] == "approved"]
@@ -558,7 +989,7 @@ async def generate_pdf_report(room_id: str):
     denied_participants = [p for p in participants if p["approval_status"] == "denied"]
     
     if approved_participants:
-        story.append(Paragraph("<b>Approved Participants:</b>", styles['Normal']))
+        story.append(Paragraph("<b>Approved Participants:</b>", NORMAL_STYLE))
         participant_data = [['Name', 'Joined At', 'Status']]
         for p in approved_participants:
             participant_data.append([
@@ -568,16 +999,7 @@ async def generate_pdf_report(room_id: str):
             ])
         
         participant_table = Table(participant_data, colWidths=[2.5*inch, 1.5*inch, 1.5*inch])
-        participant_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        participant_table.setStyle(APPROVED_TABLE_STYLE)
         story.append(participant_table)
         story.append(Spacer(1, 15))
     
@@ -589,37 +1011,25 @@ async def generate_pdf_report(room_id: str):
             other_participants.extend([(p["participant_name"], "❌ Denied") for p in denied_participants])
         
         if other_participants:
-            story.append(Paragraph("<b>Other Participants:</b>", styles['Normal']))
+            story.append(Paragraph("<b>Other Participants:</b>", NORMAL_STYLE))
             other_data = [['Name', 'Status']]
             other_data.extend(other_participants)
             
             other_table = Table(other_data, colWidths=[3*inch, 2*inch])
-            other_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            other_table.setStyle(OTHER_TABLE_STYLE)
             story.append(other_table)
             story.append(Spacer(1, 20))
     
     # Poll Results Section
     if polls:
-        story.append(Paragraph("Poll Results", heading_style))
+        story.append(Paragraph("Poll Results", HEADING_STYLE))
         
         for i, poll in enumerate(polls, 1):
-            story.append(Paragraph(f"<b>Poll {i}: {poll['question']}</b>", styles['Normal']))
+            story.append(Paragraph(f"<b>Poll {i}: {poll['question']}</b>", NORMAL_STYLE))
             
             # Calculate vote results
-            vote_counts = {}
-            for option in poll["options"]:
-                count = votes_collection.count_documents({
-                    "poll_id": poll["poll_id"],
-                    "selected_option": option
-                })
-                vote_counts[option] = count
+            poll_votes = room_vote_counts.get(poll["poll_id"], {})
+            vote_counts = {option: poll_votes.get(option, 0) for option in poll["options"]}
             
             total_votes = sum(vote_counts.values())
             
@@ -638,36 +1048,19 @@ async def generate_pdf_report(room_id: str):
                 results_data.append(['Total Votes', str(total_votes), '100.0%'])
                 
                 results_table = Table(results_data, colWidths=[2.5*inch, 1*inch, 1*inch])
-                results_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, -1), (-1, -1), colors.lightblue),
-                    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
+                results_table.setStyle(RESULTS_TABLE_STYLE)
                 story.append(results_table)
             else:
-                story.append(Paragraph("No votes recorded for this poll.", styles['Normal']))
+                story.append(Paragraph("No votes recorded for this poll.", NORMAL_STYLE))
             
             story.append(Spacer(1, 15))
     else:
-        story.append(Paragraph("No polls were created in this meeting.", styles['Normal']))
+        story.append(Paragraph("No polls were created in this meeting.", NORMAL_STYLE))
     
     # Footer
     story.append(Spacer(1, 30))
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.grey,
-        alignment=1
-    )
-    story.append(Paragraph("This report was generated automatically by the Secret Poll system.", footer_style))
-    story.append(Paragraph("All participant data has been permanently deleted after report generation.", footer_style))
+    story.append(Paragraph("This report was generated automatically by the Secret Poll system.", FOOTER_STYLE))
+    story.append(Paragraph("All participant data has been permanently deleted after report generation.", FOOTER_STYLE))
     
     # Build PDF
     doc.build(story)
@@ -676,6 +1069,31 @@ async def generate_pdf_report(room_id: str):
     pdf_data = buffer.getvalue()
     buffer.close()
     
+    return pdf_data
+
+@app.get("/api/rooms/{room_id}/report")
+async def generate_pdf_report(room_id: str):
+    room = await rooms_collection.find_one({"room_id": room_id}, {"_id": 0, "room_id": 1, "organizer_name": 1})
+    if not room:
+        raise HTTPException(status_code=404, detail="Room not found")
+    
+    # Get all polls for this room
+    polls = await polls_collection.find(
+        {"room_id": room_id},
+        {"_id": 0, "poll_id": 1, "question": 1, "options": 1}
+    ).to_list(length=None)
+    
+    # Get all participants
+    participants = await participants_collection.find(
+        {"room_id": room_id},
+        {"_id": 0, "participant_name": 1, "approval_status": 1, "joined_at": 1}
+    ).to_list(length=None)
+    
+    room_vote_counts = await count_room_votes(room_id)
+    
+    # ReportLab is synchronous; build the PDF in a worker thread
+    pdf_data = await anyio.to_thread.run_sync(render_pdf_report, room, polls, participants, room_vote_counts)
+    
     # Create filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"poll_report_{room_id}_{timestamp}.pdf"
@@ -691,11 +1109,21 @@ async def generate_pdf_report(room_id: str):
 
 @app.delete("/api/rooms/{room_id}/cleanup")
 async def cleanup_room_data(room_id: str):
-    # Delete all data for this room
-    rooms_collection.delete_many({"room_id": room_id})
-    polls_collection.delete_many({"room_id": room_id})
-    votes_collection.delete_many({"room_id": room_id})
-    participants_collection.delete_many({"room_id": room_id})
+    # Delete all data for this room, one concurrent delete per collection
+    room_filter = {"room_id": room_id}
+    
+    # Forget this worker's timers for the room's polls
+    async for poll in polls_collection.find(room_filter, {"_id": 0, "poll_id": 1}):
+        cancel_poll_stop(poll["poll_id"])
+    
+    await asyncio.gather(
+        rooms_collection.delete_many(room_filter),
+        polls_collection.delete_many(room_filter),
+        votes_collection.delete_many(room_filter),
+        participants_collection.delete_many(room_filter)
+    )
+    # Evicted once the room is gone, so no worker can cache it again in between
+    await manager.evict_room(room_id)
     
     return {"message": "Room data deleted successfully"}
 
@@ -704,12 +1132,26 @@ async def cleanup_room_data(room_id: str):
 async def websocket_endpoint(websocket: WebSocket, room_id: str):
     await manager.connect(websocket, room_id)
     try:
-        while True:
-            data = await websocket.receive_text()
-            # Keep connection alive
-    except WebSocketDisconnect:
+        # Incoming frames only keep the connection alive, so read the raw ASGI
+        # messages and never decode them; text and binary frames are both fine
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+    finally:
         manager.disconnect(websocket, room_id)
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+    # Workers need the app as an import string; set REDIS_URL when running more than one
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=8001,
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1")),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop is POSIX-only
+        http="httptools",
+        backlog=4096,  # room for a burst of clients (re)connecting at once
+        # Protocol-level pings detect dead clients; the endpoint never needs app heartbeats
+        ws_ping_interval=20,
+        ws_ping_timeout=20
+    )
\ No newline at end of file
@@ -24,11 +24,14 @@ function App() {
       let websocket;
       let reconnectAttempts = 0;
       const maxReconnectAttempts = 5;
+      const textDecoder = new TextDecoder();
       
       const connectWebSocket = () => {
         try {
           const wsUrl = `${BACKEND_URL.replace('http', 'ws')}/api/ws/${roomData.room_id}`;
           websocket = new WebSocket(wsUrl);
+          // Server broadcasts pre-encoded JSON as binary frames
+          websocket.binaryType = 'arraybuffer';
           
           websocket.onopen = () => {
             console.log('WebSocket connected');
@@ -37,7 +40,8 @@ function App() {
           
           websocket.onmessage = (event) => {
             try {
-              const data = JSON.parse(event.data);
+              const raw = typeof event.data === 'string' ? event.data : textDecoder.decode(event.data);
+              const data = JSON.parse(raw);
               
               switch (data.type) {
                 case 'participant_update':